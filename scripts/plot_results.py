@@ -3,117 +3,205 @@
 plot_results.py - Grafica las curvas R vs N para diferentes valores de B
 Genera los gráficos requeridos en el punto 2 y 3 del proyecto
 
-Uso: python3 plot_results.py <results_dir>
+Uso: python3 plot_results.py <results_dir> [--dashboard]
 Ejemplo: python3 plot_results.py results/
+
+Con --dashboard se genera un único panel (analysis_dashboard.png) en lugar
+de los tres gráficos por separado.
+
+Variables de entorno (útiles durante el desarrollo):
+  PLOT_DPI=100   resolución de los PNG (por defecto 300)
+  PLOT_TIGHT=0   omite bbox_inches='tight' (evita una pasada extra de render)
 """
 
 import sys
 import os
-import glob
-import pandas as pd
+import io
+import warnings
+import matplotlib
+matplotlib.use('Agg')  # Solo se generan archivos PNG; no se necesita backend GUI
 import matplotlib.pyplot as plt
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from types import SimpleNamespace
+
+try:
+    import numba as nb
+except ImportError:  # numba es opcional; se usa la versión vectorizada de NumPy
+    nb = None
+
+# Simplificar trayectorias de líneas antes de rasterizar
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+plt.rcParams['text.hinting'] = 'none'
+
+# Parámetros de guardado; ver docstring del módulo
+DPI = int(os.environ.get('PLOT_DPI', '300'))
+TIGHT = os.environ.get('PLOT_TIGHT', '1') == '1'
+
+# Figura única reutilizada por todos los gráficos (su creación también
+# deja precargada la caché de fuentes)
+FIG = plt.figure(figsize=(14, 7))
+
+def reset_figure(figsize):
+    """Limpia la figura compartida y ajusta su tamaño para un nuevo gráfico"""
+    FIG.clear()
+    FIG.set_size_inches(figsize)
+    return FIG
+
+def read_calibration_csv(csv_file):
+    """Lee un CSV de calibración como arreglos (N, R_min, success_rate); None si no tiene filas"""
+    # Las columnas son puramente numéricas; avg_time_s no se usa
+    with warnings.catch_warnings():
+        # El archivo vacío se reporta en load_calibration_data
+        warnings.filterwarnings('ignore', message='loadtxt: input contained no data')
+        arr = np.loadtxt(csv_file, delimiter=',', skiprows=1, usecols=(0, 1, 2),
+                         dtype=np.float32, ndmin=2)
+    
+    if arr.shape[0] == 0:
+        return None
+    
+    # Tipos compactos: N y R_min son enteros pequeños, success_rate es una probabilidad
+    return SimpleNamespace(N=arr[:, 0].astype(np.int16),
+                           R_min=arr[:, 1].astype(np.int16),
+                           success_rate=np.ascontiguousarray(arr[:, 2]))
 
 def load_calibration_data(results_dir):
     """Carga todos los archivos CSV de calibración"""
-    csv_files = glob.glob(os.path.join(results_dir, "r_vs_n_B*.csv"))
+    prefix, suffix = "r_vs_n_B", ".csv"
+    with os.scandir(results_dir) as entries:
+        csv_files = [(entry.name, entry.path) for entry in entries
+                     if entry.name.startswith(prefix) and entry.name.endswith(suffix)
+                     and entry.is_file()]
     
     if not csv_files:
         print(f"Error: No se encontraron archivos CSV en {results_dir}")
         return None
     
     data = {}
-    for csv_file in sorted(csv_files):
+    for filename, csv_file in sorted(csv_files):
         # Extraer valor de B del nombre del archivo
-        filename = os.path.basename(csv_file)
-        b_str = filename.replace("r_vs_n_B", "").replace(".csv", "")
+        b_str = filename[len(prefix):-len(suffix)]
         try:
             b_value = float(b_str)
         except ValueError:
             print(f"Advertencia: No se pudo extraer B de {filename}")
             continue
         
-        df = pd.read_csv(csv_file)
-        data[b_value] = df
-        print(f"✓ Cargado: {filename} ({len(df)} puntos)")
+        calib = read_calibration_csv(csv_file)
+        if calib is None:
+            print(f"Advertencia: {filename} no contiene datos, se omite")
+            continue
+        
+        data[b_value] = calib
+        print(f"✓ Cargado: {filename} ({len(calib.N)} puntos)")
     
     return data
 
-def plot_r_vs_n_comparison(data, output_dir):
-    """Gráfico principal: R mínimo vs N para diferentes valores de B"""
-    plt.figure(figsize=(12, 7))
-    
+if nb is not None:
+    @nb.njit(cache=True, parallel=True)
+    def compute_overhead(r_matrix, baseline_col):
+        """Overhead (%) de cada celda de r_matrix respecto a su fila en baseline_col"""
+        out = np.empty(r_matrix.shape, dtype=np.float64)
+        for i in nb.prange(r_matrix.shape[0]):
+            b = baseline_col[i]
+            for j in range(r_matrix.shape[1]):
+                out[i, j] = (r_matrix[i, j] - b) / b * 100.0
+        return out
+else:
+    def compute_overhead(r_matrix, baseline_col):
+        """Overhead (%) de cada celda de r_matrix respecto a su fila en baseline_col"""
+        base = baseline_col[:, np.newaxis]
+        return (r_matrix - base) / base * 100.0
+
+def pivot_r_min(data, b_values):
+    """Matriz de R_min: una fila por N (n_index ascendente), una columna por B"""
+    if not b_values:
+        return np.empty(0, dtype=np.int16), np.empty((0, 0))
+    
+    n_index = np.unique(np.concatenate([data[b].N for b in b_values]))
+    r_matrix = np.full((len(n_index), len(b_values)), np.nan)
+    # Combinaciones (N, B) sin datos quedan como NaN
+    for j, b in enumerate(b_values):
+        rows = np.searchsorted(n_index, data[b].N)
+        r_matrix[rows, j] = data[b].R_min
+    return n_index, r_matrix
+
+def save_figure(fig, output_dir, filename):
+    """Ajusta el layout y guarda la figura como PNG en output_dir"""
+    fig.tight_layout()
+    output_file = os.path.join(output_dir, filename)
+    fig.savefig(output_file, dpi=DPI, bbox_inches='tight' if TIGHT else None)
+    print(f"✓ Guardado: {output_file}")
+
+def draw_r_vs_n_comparison(ax, data, b_values):
+    """Dibuja R mínimo vs N para cada valor de B sobre ax"""
     colors = ['#2E86AB', '#A23B72', '#F18F01', '#C73E1D']
     markers = ['o', 's', '^', 'D']
     
-    for idx, (b_value, df) in enumerate(sorted(data.items())):
+    for idx, b_value in enumerate(b_values):
+        calib = data[b_value]
         color = colors[idx % len(colors)]
         marker = markers[idx % len(markers)]
         
         # Filtrar puntos donde R_min es válido (no excede MAX_ROBOTS)
-        valid_df = df[df['R_min'] <= 20]
+        n_arr = calib.N
+        r_arr = calib.R_min
+        valid = r_arr <= 20
         
-        plt.plot(valid_df['N'], valid_df['R_min'], 
+        ax.plot(n_arr[valid], r_arr[valid], 
                 marker=marker, markersize=6,
                 label=f'B = {b_value:.3f}',
-                color=color, linewidth=2, alpha=0.8)
+                color=color, linewidth=2, alpha=0.8, rasterized=True)
         
         # Marcar puntos donde falló (requiere más robots)
-        failed_df = df[df['R_min'] > 20]
-        if not failed_df.empty:
-            plt.scatter(failed_df['N'], [20] * len(failed_df),
-                       color=color, marker='x', s=100, alpha=0.5)
-    
-    plt.xlabel('Número de Mangos (N)', fontsize=12, fontweight='bold')
-    plt.ylabel('Robots Mínimos Requeridos (R)', fontsize=12, fontweight='bold')
-    plt.title('MangoNeado: Número Óptimo de Robots vs Carga de Trabajo\n' +
-              'Con Diferentes Probabilidades de Falla (B)', 
-              fontsize=14, fontweight='bold', pad=20)
-    plt.legend(fontsize=10, loc='upper left', framealpha=0.9)
-    plt.grid(True, alpha=0.3, linestyle='--')
+        failed = ~valid
+        if failed.any():
+            ax.scatter(n_arr[failed], np.full(int(failed.sum()), 20.0),
+                       color=color, marker='x', s=100, alpha=0.5,
+                       rasterized=True)
+    
+    ax.set_xlabel('Número de Mangos (N)', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Robots Mínimos Requeridos (R)', fontsize=12, fontweight='bold')
+    ax.set_title('MangoNeado: Número Óptimo de Robots vs Carga de Trabajo\n' +
+                 'Con Diferentes Probabilidades de Falla (B)', 
+                 fontsize=14, fontweight='bold', pad=20)
+    ax.legend(fontsize=10, loc='upper left', framealpha=0.9)
+    ax.grid(True, alpha=0.3, linestyle='--')
     
     # Agregar zona óptima visual
     if data:
-        first_df = list(data.values())[0]
-        n_range = first_df['N'].max() - first_df['N'].min()
-        plt.axvspan(first_df['N'].min(), 
-                   first_df['N'].min() + n_range * 0.3,
-                   alpha=0.1, color='green', label='Zona de baja carga')
-    
-    plt.tight_layout()
-    output_file = os.path.join(output_dir, 'r_vs_n_comparison.png')
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
-    print(f"✓ Guardado: {output_file}")
-    plt.close()
+        first_n = data[b_values[0]].N
+        n_range = first_n.max() - first_n.min()
+        ax.axvspan(first_n.min(), 
+                  first_n.min() + n_range * 0.3,
+                  alpha=0.1, color='green', label='Zona de baja carga')
 
-def plot_cost_effectiveness(data, output_dir):
-    """Análisis costo-efectividad: R vs N con curvas de isocosto"""
-    plt.figure(figsize=(12, 7))
-    
-    # Usar datos con B=0 (sin fallas)
-    if 0.0 not in data:
-        print("Advertencia: No hay datos con B=0.0")
-        return
-    
-    df = data[0.0]
+def plot_r_vs_n_comparison(data, b_values, output_dir):
+    """Gráfico principal: R mínimo vs N para diferentes valores de B"""
+    fig = reset_figure((12, 7))
+    draw_r_vs_n_comparison(fig.add_subplot(), data, b_values)
+    save_figure(fig, output_dir, 'r_vs_n_comparison.png')
+
+def draw_cost_effectiveness(ax1, ax2, calib):
+    """Dibuja R vs N y la eficiencia (mangos/robot) de calib sobre ax1 y ax2"""
+    n_arr = calib.N
+    r_arr = calib.R_min
     
     # Calcular "eficiencia" = N / R (mangos por robot)
-    df['efficiency'] = df['N'] / df['R_min']
-    
-    # Graficar eficiencia
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+    efficiency = n_arr / r_arr
     
     # Subplot 1: R vs N con zona óptima
-    ax1.plot(df['N'], df['R_min'], 'o-', linewidth=2, markersize=8,
+    ax1.plot(n_arr, r_arr, 'o-', linewidth=2, markersize=8,
             color='#2E86AB', label='R mínimo')
     
     # Línea teórica ideal (lineal)
-    ideal_ratio = df['R_min'].iloc[0] / df['N'].iloc[0]
-    ax1.plot(df['N'], df['N'] * ideal_ratio, '--', 
+    ideal_ratio = r_arr[0] / n_arr[0]
+    ax1.plot(n_arr, n_arr * ideal_ratio, '--', 
             color='gray', alpha=0.5, label='Escalado lineal ideal')
     
-    ax1.fill_between(df['N'], df['R_min'], df['R_min'] * 1.2,
+    ax1.fill_between(n_arr, r_arr, r_arr * 1.2,
                      alpha=0.2, color='green',
                      label='Zona sobre-aprovisionada (+20%)')
     
@@ -124,7 +212,7 @@ def plot_cost_effectiveness(data, output_dir):
     ax1.grid(True, alpha=0.3)
     
     # Subplot 2: Eficiencia (mangos/robot)
-    ax2.plot(df['N'], df['efficiency'], 's-', linewidth=2, markersize=8,
+    ax2.plot(n_arr, efficiency, 's-', linewidth=2, markersize=8,
             color='#F18F01')
     ax2.set_xlabel('Número de Mangos (N)', fontweight='bold')
     ax2.set_ylabel('Eficiencia (Mangos / Robot)', fontweight='bold')
@@ -132,45 +220,40 @@ def plot_cost_effectiveness(data, output_dir):
     ax2.grid(True, alpha=0.3)
     
     # Marcar punto óptimo (máxima eficiencia)
-    max_eff_idx = df['efficiency'].idxmax()
-    optimal_n = df.loc[max_eff_idx, 'N']
-    optimal_r = df.loc[max_eff_idx, 'R_min']
-    optimal_eff = df.loc[max_eff_idx, 'efficiency']
+    max_eff_idx = int(efficiency.argmax())
+    optimal_n = n_arr[max_eff_idx]
+    optimal_r = r_arr[max_eff_idx]
+    optimal_eff = efficiency[max_eff_idx]
     
     ax2.axvline(optimal_n, color='red', linestyle='--', alpha=0.5)
     ax2.text(optimal_n, optimal_eff * 1.05, 
             f'Óptimo: N={int(optimal_n)}, R={int(optimal_r)}',
             ha='center', fontweight='bold', color='red')
-    
-    plt.tight_layout()
-    output_file = os.path.join(output_dir, 'cost_effectiveness.png')
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
-    print(f"✓ Guardado: {output_file}")
-    plt.close()
 
-def plot_redundancy_analysis(data, output_dir):
-    """Análisis del impacto de la redundancia (diferentes valores de B)"""
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+def plot_cost_effectiveness(data, output_dir):
+    """Análisis costo-efectividad: R vs N con curvas de isocosto"""
+    # Usar datos con B=0 (sin fallas)
+    if 0.0 not in data:
+        print("Advertencia: No hay datos con B=0.0")
+        return
     
+    fig = reset_figure((14, 6))
+    ax1, ax2 = fig.subplots(1, 2)
+    draw_cost_effectiveness(ax1, ax2, data[0.0])
+    save_figure(fig, output_dir, 'cost_effectiveness.png')
+
+def draw_redundancy_analysis(ax1, ax2, data, b_values):
+    """Dibuja R vs B por carga y el overhead de redundancia sobre ax1 y ax2"""
     # Subplot 1: Incremento de robots necesarios vs B
-    b_values = sorted(data.keys())
+    n_index, r_matrix = pivot_r_min(data, b_values)
     
     # Para cada N, ver cómo cambia R con B
     if data:
         sample_n_values = [10, 20, 30, 40, 50]
         
         for n_target in sample_n_values:
-            r_values = []
-            for b in b_values:
-                df = data[b]
-                match = df[df['N'] == n_target]
-                if not match.empty:
-                    r_values.append(match['R_min'].values[0])
-                else:
-                    # Interpolar
-                    r_values.append(np.nan)
-            
-            if not all(np.isnan(r_values)):
+            r_values = find_r_min(n_index, r_matrix, n_target)
+            if r_values is not None and not np.isnan(r_values).all():
                 ax1.plot(b_values, r_values, 'o-', label=f'N={n_target}', 
                         linewidth=2, markersize=6)
         
@@ -182,32 +265,20 @@ def plot_redundancy_analysis(data, output_dir):
         ax1.grid(True, alpha=0.3)
     
     # Subplot 2: Overhead de redundancia (%)
-    baseline_data = data.get(0.0)
-    if baseline_data is not None:
-        for b in b_values:
+    if 0.0 in data:
+        baseline_col = np.ascontiguousarray(r_matrix[:, b_values.index(0.0)])
+        overhead = compute_overhead(r_matrix, baseline_col)
+        
+        for j, b in enumerate(b_values):
             if b == 0.0:
                 continue
             
-            df_b = data[b]
-            
-            # Calcular overhead
-            overhead = []
-            n_common = []
+            # Solo los N presentes tanto en B como en B=0
+            present = ~np.isnan(overhead[:, j])
             
-            for _, row in df_b.iterrows():
-                n = row['N']
-                r_with_b = row['R_min']
-                
-                baseline_match = baseline_data[baseline_data['N'] == n]
-                if not baseline_match.empty:
-                    r_baseline = baseline_match['R_min'].values[0]
-                    overhead_pct = ((r_with_b - r_baseline) / r_baseline) * 100
-                    overhead.append(overhead_pct)
-                    n_common.append(n)
-            
-            if overhead:
-                ax2.plot(n_common, overhead, 'o-', label=f'B={b:.3f}',
-                        linewidth=2, markersize=6)
+            if present.any():
+                ax2.plot(n_index[present], overhead[present, j], 'o-',
+                        label=f'B={b:.3f}', linewidth=2, markersize=6)
         
         ax2.axhline(0, color='black', linestyle='-', linewidth=0.5)
         ax2.set_xlabel('Número de Mangos (N)', fontweight='bold')
@@ -215,92 +286,158 @@ def plot_redundancy_analysis(data, output_dir):
         ax2.set_title('Costo de Tolerancia a Fallas', fontweight='bold')
         ax2.legend()
         ax2.grid(True, alpha=0.3)
+
+def plot_redundancy_analysis(data, b_values, output_dir):
+    """Análisis del impacto de la redundancia (diferentes valores de B)"""
+    fig = reset_figure((14, 6))
+    ax1, ax2 = fig.subplots(1, 2)
+    draw_redundancy_analysis(ax1, ax2, data, b_values)
+    save_figure(fig, output_dir, 'redundancy_analysis.png')
+
+def plot_all_in_one(data, b_values, output_dir):
+    """Panel único 2x3 con los tres análisis (una sola figura y un solo savefig)"""
+    fig = reset_figure((20, 12))
+    axes = fig.subplots(2, 3)
+    
+    draw_r_vs_n_comparison(axes[0, 0], data, b_values)
+    if 0.0 in data:
+        draw_cost_effectiveness(axes[0, 1], axes[0, 2], data[0.0])
+    else:
+        print("Advertencia: No hay datos con B=0.0")
+    draw_redundancy_analysis(axes[1, 0], axes[1, 1], data, b_values)
+    axes[1, 2].axis('off')
     
-    plt.tight_layout()
-    output_file = os.path.join(output_dir, 'redundancy_analysis.png')
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
-    print(f"✓ Guardado: {output_file}")
-    plt.close()
+    save_figure(fig, output_dir, 'analysis_dashboard.png')
+
+def find_r_min(n_arr, r_arr, n_target):
+    """Busca en n_arr (ascendente) el valor o fila de r_arr para n_target; None si no existe"""
+    idx = np.searchsorted(n_arr, n_target)
+    if idx < len(n_arr) and n_arr[idx] == n_target:
+        return r_arr[idx]
+    return None
 
-def generate_summary_report(data, output_dir):
+def summarize_by_b(data, b_values):
+    """Estadísticas por B (en orden de b_values) con reducciones agrupadas de NumPy"""
+    counts = np.array([len(data[b].N) for b in b_values])
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    codes = np.repeat(np.arange(len(b_values)), counts)
+    
+    # Todas las series concatenadas: cada B ocupa un segmento contiguo
+    n_all = np.concatenate([data[b].N for b in b_values])
+    r_all = np.concatenate([data[b].R_min for b in b_values])
+    succ_all = np.concatenate([data[b].success_rate for b in b_values])
+    
+    # Eficiencia y tasa de éxito solo sobre puntos válidos (R_min <= 20)
+    valid = r_all <= 20
+    valid_codes = codes[valid]
+    n_valid = np.bincount(valid_codes, minlength=len(b_values))
+    eff_sum = np.bincount(valid_codes, weights=n_all[valid] / r_all[valid],
+                          minlength=len(b_values))
+    succ_sum = np.bincount(valid_codes, weights=succ_all[valid],
+                           minlength=len(b_values))
+    
+    # reduceat no admite segmentos vacíos: se reduce solo sobre los B con
+    # datos y el resto queda como NaN
+    nonempty = counts > 0
+    
+    def reduce_segments(ufunc, values):
+        out = np.full(len(b_values), np.nan)
+        if nonempty.any():
+            out[nonempty] = ufunc.reduceat(values, starts[nonempty])
+        return out
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return SimpleNamespace(
+            n_min=reduce_segments(np.minimum, n_all),
+            n_max=reduce_segments(np.maximum, n_all),
+            r_min=reduce_segments(np.minimum, r_all),
+            r_max=reduce_segments(np.maximum, r_all),
+            n_valid=n_valid,
+            avg_efficiency=eff_sum / n_valid,
+            avg_success=succ_sum / n_valid,
+        )
+
+def generate_summary_report(data, b_values, output_dir):
     """Genera reporte de texto con estadísticas clave"""
     report_file = os.path.join(output_dir, 'analysis_report.txt')
     
-    with open(report_file, 'w', encoding='utf-8') as f:
-        f.write("="*70 + "\n")
-        f.write(" MangoNeado - Reporte de Análisis de Calibración\n")
-        f.write("="*70 + "\n\n")
-        
-        for b_value, df in sorted(data.items()):
-            f.write(f"\n--- Probabilidad de Falla B = {b_value:.3f} ---\n")
-            f.write(f"  Rango de mangos (N): {df['N'].min():.0f} - {df['N'].max():.0f}\n")
-            f.write(f"  Robots mínimos:      {df['R_min'].min():.0f}\n")
-            f.write(f"  Robots máximos:      {df['R_min'].max():.0f}\n")
-            
-            # Calcular eficiencia promedio
-            df_valid = df[df['R_min'] <= 20]
-            if not df_valid.empty:
-                avg_efficiency = (df_valid['N'] / df_valid['R_min']).mean()
-                f.write(f"  Eficiencia promedio: {avg_efficiency:.2f} mangos/robot\n")
-                
-                # Tasa de éxito promedio
-                avg_success = df_valid['success_rate'].mean() * 100
-                f.write(f"  Tasa éxito promedio: {avg_success:.1f}%\n")
-        
-        # Recomendaciones
-        f.write("\n" + "="*70 + "\n")
-        f.write(" RECOMENDACIONES\n")
-        f.write("="*70 + "\n")
+    # Todo el reporte se arma en memoria y se escribe de una sola vez
+    buf = io.StringIO()
+    rule = "=" * 70 + "\n"
+    
+    buf.write(rule)
+    buf.write(" MangoNeado - Reporte de Análisis de Calibración\n")
+    buf.write(rule + "\n")
+    
+    stats = summarize_by_b(data, b_values)
+    for i, b_value in enumerate(b_values):
+        buf.write(f"\n--- Probabilidad de Falla B = {b_value:.3f} ---\n")
+        buf.write(f"  Rango de mangos (N): {stats.n_min[i]:.0f} - {stats.n_max[i]:.0f}\n")
+        buf.write(f"  Robots mínimos:      {stats.r_min[i]:.0f}\n")
+        buf.write(f"  Robots máximos:      {stats.r_max[i]:.0f}\n")
         
-        if 0.0 in data:
-            df_base = data[0.0]
-            df_valid = df_base[df_base['R_min'] <= 20]
-            
-            if not df_valid.empty:
-                # Encontrar punto óptimo
-                df_valid['efficiency'] = df_valid['N'] / df_valid['R_min']
-                optimal_idx = df_valid['efficiency'].idxmax()
-                
-                optimal_n = df_valid.loc[optimal_idx, 'N']
-                optimal_r = df_valid.loc[optimal_idx, 'R_min']
-                optimal_eff = df_valid.loc[optimal_idx, 'efficiency']
-                
-                f.write(f"\n1. PUNTO ÓPTIMO DE OPERACIÓN (sin fallas):\n")
-                f.write(f"   - Configuración: N={optimal_n:.0f} mangos, R={optimal_r:.0f} robots\n")
-                f.write(f"   - Eficiencia: {optimal_eff:.2f} mangos/robot\n")
-                f.write(f"   - Esta configuración maximiza la utilización de recursos\n")
+        if stats.n_valid[i]:
+            # Eficiencia y tasa de éxito promedio
+            buf.write(f"  Eficiencia promedio: {stats.avg_efficiency[i]:.2f} mangos/robot\n")
+            buf.write(f"  Tasa éxito promedio: {stats.avg_success[i] * 100:.1f}%\n")
+    
+    # Recomendaciones
+    buf.write("\n" + rule)
+    buf.write(" RECOMENDACIONES\n")
+    buf.write(rule)
+    
+    if 0.0 in data:
+        calib = data[0.0]
+        mask = calib.R_min <= 20
         
-        f.write(f"\n2. IMPACTO DE REDUNDANCIA:\n")
-        if 0.0 in data and 0.05 in data:
-            df_0 = data[0.0]
-            df_005 = data[0.05]
+        if mask.any():
+            # Encontrar punto óptimo
+            n_valid = calib.N[mask]
+            r_valid = calib.R_min[mask]
+            efficiency = n_valid / r_valid
+            optimal_idx = int(efficiency.argmax())
             
-            # Comparar en N=30 (punto medio típico)
-            n_compare = 30
-            r_0 = df_0[df_0['N'] == n_compare]['R_min'].values
-            r_005 = df_005[df_005['N'] == n_compare]['R_min'].values
+            optimal_n = n_valid[optimal_idx]
+            optimal_r = r_valid[optimal_idx]
+            optimal_eff = efficiency[optimal_idx]
             
-            if len(r_0) > 0 and len(r_005) > 0:
-                overhead = ((r_005[0] - r_0[0]) / r_0[0]) * 100
-                f.write(f"   - Con B=0.05, se requiere {overhead:.1f}% más robots\n")
-                f.write(f"   - Ejemplo: N=30 mangos requiere {r_0[0]:.0f} robots (B=0) " +
-                       f"vs {r_005[0]:.0f} robots (B=0.05)\n")
+            buf.write(f"\n1. PUNTO ÓPTIMO DE OPERACIÓN (sin fallas):\n")
+            buf.write(f"   - Configuración: N={optimal_n:.0f} mangos, R={optimal_r:.0f} robots\n")
+            buf.write(f"   - Eficiencia: {optimal_eff:.2f} mangos/robot\n")
+            buf.write(f"   - Esta configuración maximiza la utilización de recursos\n")
+    
+    buf.write(f"\n2. IMPACTO DE REDUNDANCIA:\n")
+    if 0.0 in data and 0.05 in data:
+        # Comparar en N=30 (punto medio típico)
+        n_compare = 30
+        r_0 = find_r_min(data[0.0].N, data[0.0].R_min, n_compare)
+        r_005 = find_r_min(data[0.05].N, data[0.05].R_min, n_compare)
         
-        f.write(f"\n3. ESCALABILIDAD:\n")
-        f.write(f"   - El sistema escala aproximadamente linealmente con N\n")
-        f.write(f"   - Para cargas de 1.2×N, planificar incremento proporcional de robots\n")
-        
-        f.write(f"\n" + "="*70 + "\n")
+        if r_0 is not None and r_005 is not None:
+            overhead = ((r_005 - r_0) / r_0) * 100
+            buf.write(f"   - Con B=0.05, se requiere {overhead:.1f}% más robots\n")
+            buf.write(f"   - Ejemplo: N=30 mangos requiere {r_0:.0f} robots (B=0) " +
+                      f"vs {r_005:.0f} robots (B=0.05)\n")
+    
+    buf.write(f"\n3. ESCALABILIDAD:\n")
+    buf.write(f"   - El sistema escala aproximadamente linealmente con N\n")
+    buf.write(f"   - Para cargas de 1.2×N, planificar incremento proporcional de robots\n")
+    
+    buf.write("\n" + rule)
+    
+    with open(report_file, 'w', encoding='utf-8') as f:
+        f.write(buf.getvalue())
     
     print(f"✓ Guardado: {report_file}")
 
 def main():
     if len(sys.argv) < 2:
-        print("Uso: python3 plot_results.py <results_dir>")
+        print("Uso: python3 plot_results.py <results_dir> [--dashboard]")
         print("Ejemplo: python3 plot_results.py results/")
         sys.exit(1)
     
     results_dir = sys.argv[1]
+    dashboard = '--dashboard' in sys.argv[2:]
     
     if not os.path.exists(results_dir):
         print(f"Error: Directorio {results_dir} no existe")
@@ -320,24 +457,39 @@ def main():
     
     print(f"\n✓ Cargados {len(data)} conjuntos de datos\n")
     
+    # Ordenar una sola vez los valores de B para todos los análisis
+    b_values = sorted(data)
+    
     # Generar gráficos
     print("Generando gráficos...")
-    plot_r_vs_n_comparison(data, results_dir)
-    plot_cost_effectiveness(data, results_dir)
-    plot_redundancy_analysis(data, results_dir)
+    if dashboard:
+        plot_all_in_one(data, b_values, results_dir)
+    else:
+        # Los tres gráficos son independientes: se generan en procesos separados
+        with ProcessPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(plot_r_vs_n_comparison, data, b_values, results_dir),
+                executor.submit(plot_cost_effectiveness, data, results_dir),
+                executor.submit(plot_redundancy_analysis, data, b_values, results_dir),
+            ]
+            for future in futures:
+                future.result()
     
     # Generar reporte
     print("\nGenerando reporte...")
-    generate_summary_report(data, results_dir)
+    generate_summary_report(data, b_values, results_dir)
     
     print("\n" + "="*60)
     print(" ✓ Análisis completado exitosamente")
     print("="*60)
     print(f"\nResultados guardados en: {results_dir}/")
     print("Archivos generados:")
-    print("  - r_vs_n_comparison.png")
-    print("  - cost_effectiveness.png")
-    print("  - redundancy_analysis.png")
+    if dashboard:
+        print("  - analysis_dashboard.png")
+    else:
+        print("  - r_vs_n_comparison.png")
+        print("  - cost_effectiveness.png")
+        print("  - redundancy_analysis.png")
     print("  - analysis_report.txt")
     print()
 